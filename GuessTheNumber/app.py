@@ -7,14 +7,20 @@ Principles Applied:
 - Readability counts (clear function names, docstrings)
 """
 
+import hashlib
 import os
+import queue
 import random
+import threading
+import time
 import logging
-from datetime import datetime
-from typing import Optional, Tuple, Any
-from functools import wraps
+from contextlib import contextmanager
+from typing import Optional, Tuple, Any, Iterator, List
+from functools import wraps, lru_cache
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import pyodbc
 
 # =============================================================================
@@ -33,6 +39,23 @@ class Config:
     DB_USERNAME: Optional[str] = os.environ.get('DB_USERNAME')
     DB_PASSWORD: Optional[str] = os.environ.get('DB_PASSWORD')
     
+    # Connection Pool Configuration
+    DB_POOL_MAX: int = int(os.environ.get('DB_POOL_MAX', '10'))
+    DB_POOL_IDLE_CHECK_SECONDS: float = float(os.environ.get('DB_POOL_IDLE_CHECK_SECONDS', '30'))
+    
+    # Stats Cache Configuration
+    STATS_CACHE_TTL_SECONDS: float = float(os.environ.get('STATS_CACHE_TTL_SECONDS', '30'))
+    
+    # HTTP Caching
+    INDEX_CACHE_MAX_AGE: int = 300
+    
+    # Request Size Limits
+    MAX_RESULT_BYTES: int = 256
+    MAX_BULK_BYTES: int = 128 * 1024
+    
+    # Bulk Upload Configuration
+    BULK_MAX_RESULTS: int = 1000
+    
     # Game Configuration
     MIN_NUMBER: int = 1
     MAX_NUMBER: int = 100
@@ -46,12 +69,42 @@ class Config:
 # Logging Setup
 # =============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Silent until configure_logging() runs (e.g. helpers used without create_app)
+logger.addHandler(logging.NullHandler())
+
+
+def configure_logging() -> None:
+    """
+    Configure root logging for the running application.
+    
+    Explicit: Called from create_app rather than at import, and a no-op
+    if the host (test runner, WSGI server) already configured logging.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+# =============================================================================
+# JSON Provider
+# =============================================================================
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Simple: request.get_json() and any jsonify() calls share one fast codec.
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 
 # =============================================================================
 # Flask Application Factory
@@ -62,8 +115,23 @@ def create_app() -> Flask:
     Application factory pattern.
     Simple: Single responsibility - create and configure the app.
     """
+    configure_logging()
+    
     app = Flask(__name__)
-    app.config.from_object(Config)
+    # Explicit: Only Flask and game settings belong in app.config; database
+    # settings stay on Config and are read by the connection pool.
+    app.config.update(
+        DEBUG=Config.DEBUG,
+        SECRET_KEY=Config.SECRET_KEY,
+        MIN_NUMBER=Config.MIN_NUMBER,
+        MAX_NUMBER=Config.MAX_NUMBER
+    )
+    
+    app.json = OrjsonProvider(app)
+    
+    # Explicit: Serve '/api/game/stats/' directly instead of redirecting.
+    # Must be set before routes are registered; rules bind it on creation.
+    app.url_map.strict_slashes = False
     
     register_routes(app)
     register_error_handlers(app)
@@ -75,6 +143,40 @@ def create_app() -> Flask:
 # Database Connection
 # =============================================================================
 
+def build_connection_string() -> str:
+    """
+    Build the ODBC connection string from configuration.
+    
+    Explicit: Chooses SQL Server or Windows Authentication based on
+    whether credentials were provided.
+    """
+    if Config.DB_USERNAME and Config.DB_PASSWORD:
+        # SQL Server Authentication
+        return (
+            f"DRIVER={Config.DB_DRIVER};"
+            f"SERVER={Config.DB_SERVER};"
+            f"DATABASE={Config.DB_NAME};"
+            f"UID={Config.DB_USERNAME};"
+            f"PWD={Config.DB_PASSWORD};"
+        )
+    
+    # Windows Authentication
+    return (
+        f"DRIVER={Config.DB_DRIVER};"
+        f"SERVER={Config.DB_SERVER};"
+        f"DATABASE={Config.DB_NAME};"
+        f"Trusted_Connection=yes;"
+    )
+
+
+# Built once at import - configuration is immutable after startup
+CONNECTION_STRING: str = build_connection_string()
+
+# Keep driver-level pooling enabled; must be set before the first connect().
+# On Linux, use unixODBC 2.3.12+ to avoid handle leaks in the driver manager.
+pyodbc.pooling = True
+
+
 def get_db_connection() -> Optional[pyodbc.Connection]:
     """
     Create database connection with defensive error handling.
@@ -85,37 +187,112 @@ def get_db_connection() -> Optional[pyodbc.Connection]:
     Defensive: Returns None instead of raising exception to calling code.
     """
     try:
-        # Build connection string explicitly
-        if Config.DB_USERNAME and Config.DB_PASSWORD:
-            # SQL Server Authentication
-            connection_string = (
-                f"DRIVER={Config.DB_DRIVER};"
-                f"SERVER={Config.DB_SERVER};"
-                f"DATABASE={Config.DB_NAME};"
-                f"UID={Config.DB_USERNAME};"
-                f"PWD={Config.DB_PASSWORD};"
-            )
-        else:
-            # Windows Authentication
-            connection_string = (
-                f"DRIVER={Config.DB_DRIVER};"
-                f"SERVER={Config.DB_SERVER};"
-                f"DATABASE={Config.DB_NAME};"
-                f"Trusted_Connection=yes;"
-            )
-        
-        connection = pyodbc.connect(connection_string, timeout=5)
-        return connection
+        # Autocommit: single-statement writes skip the extra COMMIT round-trip
+        return pyodbc.connect(CONNECTION_STRING, timeout=5, autocommit=True)
         
     except pyodbc.Error as db_error:
-        logger.error(f"Database connection failed: {db_error}")
+        logger.error("Database connection failed: %s", db_error)
         return None
     except Exception as error:
-        logger.error(f"Unexpected error connecting to database: {error}")
+        logger.error("Unexpected error connecting to database: %s", error)
         return None
 
 
-def execute_query(query: str, params: tuple = (), fetch: bool = False) -> Tuple[bool, Any]:
+class ConnectionPool:
+    """
+    Bounded, process-wide pool of reusable database connections.
+    
+    Simple: The connection handshake is paid once and reused across requests.
+    Defensive: Idle connections are validated before reuse and discarded on error.
+    """
+    
+    def __init__(self, max_size: int, idle_check_seconds: float) -> None:
+        self._idle: queue.Queue = queue.Queue(maxsize=max_size)
+        self._idle_check_seconds = idle_check_seconds
+    
+    @contextmanager
+    def acquire(self) -> Iterator[Optional[pyodbc.Connection]]:
+        """
+        Borrow a connection for the duration of a `with` block.
+        
+        Yields:
+            pyodbc.Connection or None if no connection could be made
+        
+        Defensive: If the block raises, the connection may be dead (e.g. a
+        communication link failure), so it is discarded instead of re-queued.
+        Callers must therefore let pyodbc errors propagate out of the block
+        and catch them outside the `with`.
+        """
+        connection = self._checkout()
+        
+        if connection is None:
+            yield None
+            return
+        
+        try:
+            yield connection
+        except BaseException:
+            self._discard(connection)
+            raise
+        
+        self._release(connection)
+    
+    def _checkout(self) -> Optional[pyodbc.Connection]:
+        """Pop an idle connection, validating stale ones, or open a new one."""
+        while True:
+            try:
+                connection, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                return get_db_connection()
+            
+            if time.monotonic() - released_at < self._idle_check_seconds:
+                return connection
+            
+            try:
+                connection.cursor().execute("SELECT 1").fetchall()
+                return connection
+            except pyodbc.Error as db_error:
+                logger.warning("Discarding stale pooled connection: %s", db_error)
+                self._discard(connection)
+    
+    def _release(self, connection: pyodbc.Connection) -> None:
+        """Return a connection to the pool, discarding it if unusable or full."""
+        try:
+            # Explicit: Never hand out a connection with an open transaction
+            if not connection.autocommit:
+                connection.rollback()
+                connection.autocommit = True
+        except pyodbc.Error as db_error:
+            logger.warning("Discarding broken pooled connection: %s", db_error)
+            self._discard(connection)
+            return
+        
+        try:
+            self._idle.put_nowait((connection, time.monotonic()))
+        except queue.Full:
+            self._discard(connection)
+    
+    @staticmethod
+    def _discard(connection: pyodbc.Connection) -> None:
+        """Close a connection, ignoring errors from an already-dead link."""
+        try:
+            connection.close()
+        except pyodbc.Error:
+            pass
+
+
+pool = ConnectionPool(
+    max_size=Config.DB_POOL_MAX,
+    idle_check_seconds=Config.DB_POOL_IDLE_CHECK_SECONDS
+)
+
+
+def execute_query(
+    query: str,
+    params: tuple = (),
+    fetch: bool = False,
+    input_sizes: Optional[List[tuple]] = None
+) -> Tuple[bool, Any]:
     """
     Execute a database query with defensive error handling.
     
@@ -123,37 +300,317 @@ def execute_query(query: str, params: tuple = (), fetch: bool = False) -> Tuple[
         query: SQL query string with parameter placeholders
         params: Tuple of parameters to bind
         fetch: Whether to fetch results
+        input_sizes: Optional parameter types for cursor.setinputsizes
     
     Returns:
         Tuple of (success: bool, result: Any)
         
     Defensive: Always returns a tuple, never raises to caller.
     """
-    connection = get_db_connection()
+    try:
+        with pool.acquire() as connection:
+            if connection is None:
+                return (False, "Database connection unavailable")
+            
+            cursor = connection.cursor()
+            
+            if input_sizes is not None:
+                cursor.setinputsizes(input_sizes)
+            
+            cursor.execute(query, params)
+            
+            result = cursor.fetchall() if fetch else cursor.rowcount
+            
+            return (True, result)
+            
+    except pyodbc.Error as db_error:
+        logger.error("Query execution failed: %s", db_error)
+        return (False, str(db_error))
+
+
+def execute_many(
+    query: str,
+    seq_of_params: List[tuple],
+    followup: Optional[Tuple[str, tuple]] = None,
+    input_sizes: Optional[List[tuple]] = None
+) -> Tuple[bool, Any]:
+    """
+    Execute a query once per parameter tuple in a single transaction.
     
-    if connection is None:
-        return (False, "Database connection unavailable")
+    Args:
+        query: SQL query string with parameter placeholders
+        seq_of_params: List of parameter tuples, one per execution
+        followup: Optional (query, params) run after the batch, before commit
+        input_sizes: Optional parameter types for the batched query
     
-    try:
-        cursor = connection.cursor()
-        cursor.execute(query, params)
+    Returns:
+        Tuple of (success: bool, result: Any)
         
-        if fetch:
-            result = cursor.fetchall()
-        else:
+    Defensive: Always returns a tuple, never raises to caller.
+    """
+    try:
+        with pool.acquire() as connection:
+            if connection is None:
+                return (False, "Database connection unavailable")
+            
+            # Explicit: Leave autocommit for one transaction across the batch
+            connection.autocommit = False
+            
+            cursor = connection.cursor()
+            cursor.fast_executemany = True
+            
+            if input_sizes is not None:
+                cursor.setinputsizes(input_sizes)
+            
+            cursor.executemany(query, seq_of_params)
+            
+            if followup is not None:
+                # Fresh cursor: the batch's input sizes must not apply here
+                followup_query, followup_params = followup
+                connection.cursor().execute(followup_query, followup_params)
+            
+            # Explicit: One commit for the whole batch
             connection.commit()
-            result = cursor.rowcount
-        
-        return (True, result)
-        
+            return (True, len(seq_of_params))
+            
     except pyodbc.Error as db_error:
-        logger.error(f"Query execution failed: {db_error}")
+        logger.error("Batch execution failed: %s", db_error)
         return (False, str(db_error))
+
+
+# =============================================================================
+# Stats Cache
+# =============================================================================
+
+# Stats only change when a result is saved, so serve them from memory
+# until the TTL expires or a write invalidates them. The serialized body
+# and its ETag are cached together so hits skip encoding and hashing.
+# The generation is bumped on every write so a read that started before
+# the write cannot re-cache its stale result.
+_stats_cache: dict = {"body": None, "etag": None, "expires_at": 0.0, "generation": 0}
+_stats_cache_lock = threading.Lock()
+
+
+def get_cached_stats() -> Optional[Tuple[bytes, str]]:
+    """Return the cached (body, etag) pair, or None if missing or expired."""
+    with _stats_cache_lock:
+        if time.monotonic() < _stats_cache["expires_at"]:
+            return (_stats_cache["body"], _stats_cache["etag"])
+        return None
+
+
+def get_stats_generation() -> int:
+    """Return the current cache generation; capture it before querying."""
+    with _stats_cache_lock:
+        return _stats_cache["generation"]
+
+
+def set_cached_stats(payload: dict, generation: int) -> Tuple[bytes, str]:
+    """
+    Serialize a stats payload, cache it for the configured TTL, and return (body, etag).
+    
+    Defensive: Skips caching if a write invalidated the cache after
+    `generation` was captured, since the payload may predate that write.
+    """
+    body = orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    
+    with _stats_cache_lock:
+        if _stats_cache["generation"] != generation:
+            return (body, etag)
         
-    finally:
-        # Explicit resource cleanup
-        if connection:
-            connection.close()
+        _stats_cache["body"] = body
+        _stats_cache["etag"] = etag
+        _stats_cache["expires_at"] = time.monotonic() + Config.STATS_CACHE_TTL_SECONDS
+    
+    return (body, etag)
+
+
+def invalidate_stats_cache() -> None:
+    """Force the next stats request to recompute from the database."""
+    with _stats_cache_lock:
+        _stats_cache["generation"] += 1
+        _stats_cache["expires_at"] = 0.0
+
+
+# =============================================================================
+# JSON Responses
+# =============================================================================
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """Serialize data with orjson into a JSON response."""
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
+
+
+def stats_response(body: bytes, etag: str) -> Response:
+    """
+    Build a cacheable stats response.
+    
+    Explicit: Answers 304 Not Modified when If-None-Match matches the ETag.
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = int(Config.STATS_CACHE_TTL_SECONDS)
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=64)
+def error_body(message: str) -> bytes:
+    """Serialize an error payload once per distinct message."""
+    return orjson.dumps({'success': False, 'error': message})
+
+
+def error_response(message: str, status: int) -> Response:
+    """
+    Build a JSON error response from a pre-serialized body.
+    
+    Explicit: A fresh Response per request, so headers and cookies set by
+    one request never leak into another.
+    """
+    return Response(error_body(message), status=status, mimetype='application/json')
+
+
+# =============================================================================
+# Input Validation
+# =============================================================================
+
+def check_content_length(max_bytes: int) -> Optional[Response]:
+    """
+    Reject missing or oversized bodies before any JSON parsing.
+    
+    Returns:
+        Error response, or None if the declared length is acceptable
+    """
+    content_length = request.content_length
+    
+    if content_length is None:
+        return error_response('Content-Length required', 411)
+    
+    if content_length > max_bytes:
+        return error_response('Payload too large', 413)
+    
+    return None
+
+
+def validate_game_result(data: Any) -> Optional[str]:
+    """
+    Validate a single game result payload.
+    
+    Returns:
+        Error message, or None if the payload is valid
+    
+    Explicit: Shared by the single and bulk result endpoints.
+    """
+    if not isinstance(data, dict):
+        return 'Invalid result entry'
+    
+    attempts = data.get('attempts')
+    won = data.get('won')
+    
+    # Fast path: valid payloads pass with a single combined check.
+    # Exact type checks, since bool is a subclass of int.
+    if type(attempts) is int and type(won) is bool and 1 <= attempts <= 1000:
+        return None
+    
+    # Slow path: work out which specific error to report
+    if type(attempts) is not int:
+        return 'Invalid attempts value'
+    
+    if attempts < 1 or attempts > 1000:  # Reasonable bounds
+        return 'Attempts out of valid range'
+    
+    return 'Invalid won value'
+
+
+# =============================================================================
+# SQL Statements
+# =============================================================================
+
+GAME_NAME: str = 'GuessTheNumber'
+
+# Declared parameter types for (GameName, Attempts, Won) so pyodbc skips
+# per-execute type inference and fast_executemany binds matching buffers
+RESULT_INPUT_SIZES: List[tuple] = [
+    (pyodbc.SQL_WVARCHAR, 100, 0),
+    (pyodbc.SQL_INTEGER, 0, 0),
+    (pyodbc.SQL_BIT, 0, 0),
+]
+
+# Insert one result and bump the stats counters in a single batch
+INSERT_RESULT_SQL: str = """
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    DECLARE @GameName NVARCHAR(100) = ?, @Attempts INT = ?, @Won BIT = ?;
+    
+    -- Connections autocommit, so the batch brackets its own transaction
+    BEGIN TRANSACTION;
+    
+    -- PlayedAt is filled by the column default (SYSUTCDATETIME)
+    INSERT INTO GameResults (GameName, Attempts, Won)
+    VALUES (@GameName, @Attempts, @Won);
+    
+    -- UPDLOCK/SERIALIZABLE: concurrent first results cannot both insert the row
+    UPDATE GameStatsCounters WITH (UPDLOCK, SERIALIZABLE)
+    SET TotalGames = TotalGames + 1,
+        WinCount = WinCount + CASE WHEN @Won = 1 THEN 1 ELSE 0 END,
+        TotalAttemptsWon = TotalAttemptsWon
+            + CASE WHEN @Won = 1 THEN @Attempts ELSE 0 END,
+        BestScore = CASE
+            WHEN @Won = 1 AND (BestScore IS NULL OR @Attempts < BestScore)
+            THEN @Attempts ELSE BestScore END
+    WHERE GameName = @GameName;
+    
+    -- First result for this game: create its counters row
+    IF @@ROWCOUNT = 0
+        INSERT INTO GameStatsCounters (GameName, TotalGames, TotalAttemptsWon, WinCount, BestScore)
+        VALUES (
+            @GameName,
+            1,
+            CASE WHEN @Won = 1 THEN @Attempts ELSE 0 END,
+            CASE WHEN @Won = 1 THEN 1 ELSE 0 END,
+            CASE WHEN @Won = 1 THEN @Attempts ELSE NULL END
+        );
+    
+    COMMIT TRANSACTION;
+"""
+
+# Plain row insert used by executemany in the bulk endpoint
+INSERT_RESULT_ROW_SQL: str = """
+    INSERT INTO GameResults (GameName, Attempts, Won)
+    VALUES (?, ?, ?)
+"""
+
+# Apply counters aggregated across a bulk batch (upsert, runs inside the
+# batch's transaction)
+UPDATE_COUNTERS_BULK_SQL: str = """
+    SET NOCOUNT ON;
+    DECLARE @Games INT = ?, @Wins INT = ?, @AttemptsWon BIGINT = ?,
+            @BestScore INT = ?, @GameName NVARCHAR(100) = ?;
+    
+    UPDATE GameStatsCounters WITH (UPDLOCK, SERIALIZABLE)
+    SET TotalGames = TotalGames + @Games,
+        WinCount = WinCount + @Wins,
+        TotalAttemptsWon = TotalAttemptsWon + @AttemptsWon,
+        BestScore = CASE
+            WHEN @BestScore IS NOT NULL AND (BestScore IS NULL OR @BestScore < BestScore)
+            THEN @BestScore ELSE BestScore END
+    WHERE GameName = @GameName;
+    
+    IF @@ROWCOUNT = 0
+        INSERT INTO GameStatsCounters (GameName, TotalGames, TotalAttemptsWon, WinCount, BestScore)
+        VALUES (@GameName, @Games, @AttemptsWon, @Wins, @BestScore);
+"""
+
+# Point lookup on the counters row maintained by the insert statements
+STATS_SQL: str = """
+    SELECT 
+        WinCount as total_games,
+        TotalAttemptsWon * 1.0 / NULLIF(WinCount, 0) as avg_attempts,
+        BestScore as best_score
+    FROM GameStatsCounters
+    WHERE GameName = ?
+"""
 
 
 # =============================================================================
@@ -163,10 +620,25 @@ def execute_query(query: str, params: tuple = (), fetch: bool = False) -> Tuple[
 def register_routes(app: Flask) -> None:
     """Register all application routes. Simple: One place for all routes."""
     
+    # Rendered once; the template has no per-request data
+    index_html: Optional[str] = None
+    
     @app.route('/')
     def index():
-        """Serve the main game page."""
-        return render_template('index.html')
+        """
+        Serve the main game page.
+        
+        Cached: Rendered on the first request (so url_for sees the real
+        request context) and reused afterwards. Debug mode always re-renders.
+        """
+        nonlocal index_html
+        
+        if index_html is None or app.debug:
+            index_html = render_template('index.html')
+        
+        response = Response(index_html, mimetype='text/html')
+        response.headers['Cache-Control'] = f'public, max-age={Config.INDEX_CACHE_MAX_AGE}'
+        return response
     
     @app.route('/api/game/result', methods=['POST'])
     def save_game_result():
@@ -175,72 +647,114 @@ def register_routes(app: Flask) -> None:
         
         Defensive: Validate all input before processing.
         """
+        # Defensive: Cheap size check before parsing anything
+        size_error = check_content_length(Config.MAX_RESULT_BYTES)
+        if size_error is not None:
+            return size_error
+        
         # Defensive: Validate request content type
         if not request.is_json:
-            return jsonify({
-                'success': False,
-                'error': 'Content-Type must be application/json'
-            }), 400
+            return error_response('Content-Type must be application/json', 400)
         
         # Defensive: Get JSON with error handling
         try:
             data = request.get_json()
         except Exception:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid JSON payload'
-            }), 400
+            return error_response('Invalid JSON payload', 400)
         
         # Defensive: Validate required fields
         if data is None:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
-        
-        attempts = data.get('attempts')
-        won = data.get('won')
+            return error_response('No data provided', 400)
         
         # Explicit validation
-        if attempts is None or not isinstance(attempts, int):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid attempts value'
-            }), 400
-        
-        if attempts < 1 or attempts > 1000:  # Reasonable bounds
-            return jsonify({
-                'success': False,
-                'error': 'Attempts out of valid range'
-            }), 400
-        
-        if won is None or not isinstance(won, bool):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid won value'
-            }), 400
-        
-        # Save to database
-        query = """
-            INSERT INTO GameResults (GameName, Attempts, Won, PlayedAt)
-            VALUES (?, ?, ?, ?)
-        """
-        params = ('GuessTheNumber', attempts, won, datetime.utcnow())
+        error = validate_game_result(data)
+        if error is not None:
+            return error_response(error, 400)
+        
+        attempts = data['attempts']
+        won = data['won']
+        
+        # Save to database and bump the stats counters in one transaction
+        params = (GAME_NAME, attempts, won)
         
-        success, result = execute_query(query, params)
+        success, result = execute_query(
+            INSERT_RESULT_SQL, params, input_sizes=RESULT_INPUT_SIZES
+        )
         
         if success:
-            return jsonify({
+            invalidate_stats_cache()
+            return json_response({
                 'success': True,
                 'message': 'Game result saved'
-            }), 201
+            }, 201)
         else:
             # Log the error but return generic message to client
-            logger.error(f"Failed to save game result: {result}")
-            return jsonify({
-                'success': False,
-                'error': 'Failed to save result'
-            }), 500
+            logger.error("Failed to save game result: %s", result)
+            return error_response('Failed to save result', 500)
+    
+    @app.route('/api/game/results/bulk', methods=['POST'])
+    def save_game_results_bulk():
+        """
+        Save many game results in one request and one transaction.
+        
+        Defensive: Every entry is validated before any database work.
+        """
+        size_error = check_content_length(Config.MAX_BULK_BYTES)
+        if size_error is not None:
+            return size_error
+        
+        if not request.is_json:
+            return error_response('Content-Type must be application/json', 400)
+        
+        try:
+            data = request.get_json()
+        except Exception:
+            return error_response('Invalid JSON payload', 400)
+        
+        results = data.get('results') if isinstance(data, dict) else None
+        
+        if not isinstance(results, list) or not results:
+            return error_response('No results provided', 400)
+        
+        if len(results) > Config.BULK_MAX_RESULTS:
+            return error_response(
+                f'Too many results (max {Config.BULK_MAX_RESULTS})', 400
+            )
+        
+        for index, entry in enumerate(results):
+            error = validate_game_result(entry)
+            if error is not None:
+                return error_response(f'Result {index}: {error}', 400)
+        
+        rows = [
+            (GAME_NAME, entry['attempts'], entry['won'])
+            for entry in results
+        ]
+        
+        # Counters are aggregated here so the batch needs a single UPDATE
+        won_attempts = [entry['attempts'] for entry in results if entry['won']]
+        best_score = min(won_attempts) if won_attempts else None
+        counters_params = (
+            len(rows), len(won_attempts), sum(won_attempts),
+            best_score, GAME_NAME
+        )
+        
+        success, result = execute_many(
+            INSERT_RESULT_ROW_SQL, rows,
+            followup=(UPDATE_COUNTERS_BULK_SQL, counters_params),
+            input_sizes=RESULT_INPUT_SIZES
+        )
+        
+        if success:
+            invalidate_stats_cache()
+            return json_response({
+                'success': True,
+                'message': 'Game results saved',
+                'saved': result
+            }, 201)
+        else:
+            logger.error("Failed to save game results in bulk: %s", result)
+            return error_response('Failed to save results', 500)
     
     @app.route('/api/game/stats', methods=['GET'])
     def get_game_stats():
@@ -248,20 +762,19 @@ def register_routes(app: Flask) -> None:
         Get game statistics from database.
         
         Defensive: Handle missing data gracefully.
+        Cached: Served from memory until the TTL expires or a result is saved,
+        with ETag and Cache-Control headers so clients can revalidate cheaply.
         """
-        query = """
-            SELECT 
-                COUNT(*) as total_games,
-                AVG(Attempts) as avg_attempts,
-                MIN(Attempts) as best_score
-            FROM GameResults
-            WHERE GameName = 'GuessTheNumber' AND Won = 1
-        """
+        cached = get_cached_stats()
+        if cached is not None:
+            return stats_response(*cached)
+        
+        generation = get_stats_generation()
         
-        success, result = execute_query(query, fetch=True)
+        success, result = execute_query(STATS_SQL, (GAME_NAME,), fetch=True)
         
         if not success or not result:
-            return jsonify({
+            return json_response({
                 'success': True,
                 'stats': {
                     'total_games': 0,
@@ -272,14 +785,17 @@ def register_routes(app: Flask) -> None:
         
         row = result[0]
         
-        return jsonify({
+        payload = {
             'success': True,
             'stats': {
                 'total_games': row[0] or 0,
                 'avg_attempts': float(row[1]) if row[1] else None,
                 'best_score': row[2]
             }
-        })
+        }
+        body, etag = set_cached_stats(payload, generation)
+        
+        return stats_response(body, etag)
 
 
 # =============================================================================
@@ -291,25 +807,16 @@ def register_error_handlers(app: Flask) -> None:
     
     @app.errorhandler(404)
     def not_found(error):
-        return jsonify({
-            'success': False,
-            'error': 'Resource not found'
-        }), 404
+        return error_response('Resource not found', 404)
     
     @app.errorhandler(500)
     def internal_error(error):
-        logger.error(f"Internal server error: {error}")
-        return jsonify({
-            'success': False,
-            'error': 'Internal server error'
-        }), 500
+        logger.error("Internal server error: %s", error)
+        return error_response('Internal server error', 500)
     
     @app.errorhandler(405)
     def method_not_allowed(error):
-        return jsonify({
-            'success': False,
-            'error': 'Method not allowed'
-        }), 405
+        return error_response('Method not allowed', 405)
 
 
 # =============================================================================
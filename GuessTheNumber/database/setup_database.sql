@@ -53,7 +53,7 @@ BEGIN
         [Won]           BIT                 NOT NULL DEFAULT 0,
         
         -- Timestamps
-        [PlayedAt]      DATETIME2           NOT NULL DEFAULT GETUTCDATE(),
+        [PlayedAt]      DATETIME2           NOT NULL CONSTRAINT [DF_GameResults_PlayedAt] DEFAULT SYSUTCDATETIME(),
         [CreatedAt]     DATETIME2           NOT NULL DEFAULT GETUTCDATE(),
         
         -- Constraints
@@ -70,18 +70,102 @@ BEGIN
 END
 GO
 
+-- Migration: Databases created by earlier versions of this script have an
+-- unnamed GETUTCDATE() default on PlayedAt. The application no longer sends
+-- PlayedAt, so replace it with the named SYSUTCDATETIME() default.
+IF NOT EXISTS (SELECT * FROM sys.default_constraints WHERE name = N'DF_GameResults_PlayedAt' AND parent_object_id = OBJECT_ID(N'[dbo].[GameResults]'))
+BEGIN
+    DECLARE @OldDefault SYSNAME;
+    
+    SELECT @OldDefault = dc.name
+    FROM sys.default_constraints dc
+    INNER JOIN sys.columns c
+        ON c.object_id = dc.parent_object_id AND c.column_id = dc.parent_column_id
+    WHERE dc.parent_object_id = OBJECT_ID(N'[dbo].[GameResults]') AND c.name = N'PlayedAt';
+    
+    IF @OldDefault IS NOT NULL
+        EXEC (N'ALTER TABLE [dbo].[GameResults] DROP CONSTRAINT ' + QUOTENAME(@OldDefault));
+    
+    ALTER TABLE [dbo].[GameResults]
+    ADD CONSTRAINT [DF_GameResults_PlayedAt] DEFAULT SYSUTCDATETIME() FOR [PlayedAt];
+    
+    PRINT 'Default DF_GameResults_PlayedAt created successfully.';
+END
+GO
+
 -- =============================================================================
--- SECTION 3: Indexes for Performance
+-- SECTION 3: Table Creation - GameStatsCounters
 -- =============================================================================
 
--- Index for querying by game name (common query pattern)
-IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = N'IX_GameResults_GameName' AND object_id = OBJECT_ID(N'[dbo].[GameResults]'))
+-- Running totals maintained alongside each insert so stats reads are a
+-- single-row lookup instead of an aggregate over GameResults.
+IF NOT EXISTS (SELECT * FROM sys.objects WHERE object_id = OBJECT_ID(N'[dbo].[GameStatsCounters]') AND type in (N'U'))
 BEGIN
-    CREATE NONCLUSTERED INDEX [IX_GameResults_GameName]
-    ON [dbo].[GameResults] ([GameName])
-    INCLUDE ([Attempts], [Won], [PlayedAt]);
+    CREATE TABLE [dbo].[GameStatsCounters]
+    (
+        -- Primary Key
+        [GameName]          NVARCHAR(100)   NOT NULL,
+        
+        -- Counters
+        [TotalGames]        INT             NOT NULL DEFAULT 0,
+        [TotalAttemptsWon]  BIGINT          NOT NULL DEFAULT 0,
+        [WinCount]          INT             NOT NULL DEFAULT 0,
+        [BestScore]         INT             NULL,
+        
+        -- Constraints
+        CONSTRAINT [PK_GameStatsCounters] PRIMARY KEY CLUSTERED ([GameName] ASC)
+    );
+    
+    PRINT 'Table GameStatsCounters created successfully.';
+END
+ELSE
+BEGIN
+    PRINT 'Table GameStatsCounters already exists.';
+END
+GO
+
+-- Seed the counters row from any existing results (SUM over no rows is NULL)
+IF NOT EXISTS (SELECT * FROM [dbo].[GameStatsCounters] WHERE GameName = N'GuessTheNumber')
+BEGIN
+    INSERT INTO [dbo].[GameStatsCounters] ([GameName], [TotalGames], [TotalAttemptsWon], [WinCount], [BestScore])
+    SELECT 
+        N'GuessTheNumber',
+        COUNT(*),
+        ISNULL(SUM(CASE WHEN Won = 1 THEN CAST(Attempts AS BIGINT) ELSE 0 END), 0),
+        ISNULL(SUM(CASE WHEN Won = 1 THEN 1 ELSE 0 END), 0),
+        MIN(CASE WHEN Won = 1 THEN Attempts ELSE NULL END)
+    FROM [dbo].[GameResults]
+    WHERE GameName = N'GuessTheNumber';
     
-    PRINT 'Index IX_GameResults_GameName created successfully.';
+    PRINT 'GameStatsCounters seeded for GuessTheNumber.';
+END
+GO
+
+-- =============================================================================
+-- SECTION 4: Indexes for Performance
+-- =============================================================================
+
+-- Replaced by IX_GameResults_Game_Won, which has the same leading key.
+-- Stats are read from GameStatsCounters, so keeping both would only add
+-- write cost to every insert.
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = N'IX_GameResults_GameName' AND object_id = OBJECT_ID(N'[dbo].[GameResults]'))
+BEGIN
+    DROP INDEX [IX_GameResults_GameName] ON [dbo].[GameResults];
+    
+    PRINT 'Index IX_GameResults_GameName dropped (superseded).';
+END
+GO
+
+-- Index for querying by game name; covers won-game aggregates
+-- (stats fallback / counters rebuild)
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = N'IX_GameResults_Game_Won' AND object_id = OBJECT_ID(N'[dbo].[GameResults]'))
+BEGIN
+    CREATE NONCLUSTERED INDEX [IX_GameResults_Game_Won]
+    ON [dbo].[GameResults] ([GameName], [Won])
+    INCLUDE ([Attempts])
+    WITH (DATA_COMPRESSION = PAGE);
+    
+    PRINT 'Index IX_GameResults_Game_Won created successfully.';
 END
 GO
 
@@ -97,7 +181,7 @@ END
 GO
 
 -- =============================================================================
--- SECTION 4: Stored Procedures
+-- SECTION 5: Stored Procedures
 -- =============================================================================
 
 -- Procedure: Insert Game Result
@@ -115,6 +199,9 @@ CREATE PROCEDURE [dbo].[usp_InsertGameResult]
 AS
 BEGIN
     SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    
+    DECLARE @NewId INT;
     
     -- Defensive: Validate inputs
     IF @GameName IS NULL OR LEN(TRIM(@GameName)) = 0
@@ -131,14 +218,44 @@ BEGIN
     
     -- Default PlayedAt to current UTC time if not provided
     IF @PlayedAt IS NULL
-        SET @PlayedAt = GETUTCDATE();
+        SET @PlayedAt = SYSUTCDATETIME();
+    
+    -- Insert the record and keep GameStatsCounters in step, atomically
+    BEGIN TRANSACTION;
     
-    -- Insert the record
     INSERT INTO [dbo].[GameResults] ([GameName], [Attempts], [Won], [PlayedAt])
     VALUES (@GameName, @Attempts, @Won, @PlayedAt);
     
+    SET @NewId = SCOPE_IDENTITY();
+    
+    -- UPDLOCK/SERIALIZABLE: concurrent first results cannot both insert the row
+    UPDATE [dbo].[GameStatsCounters] WITH (UPDLOCK, SERIALIZABLE)
+    SET TotalGames = TotalGames + 1,
+        WinCount = WinCount + CASE WHEN @Won = 1 THEN 1 ELSE 0 END,
+        TotalAttemptsWon = TotalAttemptsWon
+            + CASE WHEN @Won = 1 THEN @Attempts ELSE 0 END,
+        BestScore = CASE
+            WHEN @Won = 1 AND (BestScore IS NULL OR @Attempts < BestScore)
+            THEN @Attempts ELSE BestScore END
+    WHERE GameName = @GameName;
+    
+    -- First result for a new game: create its counters row
+    IF @@ROWCOUNT = 0
+    BEGIN
+        INSERT INTO [dbo].[GameStatsCounters] ([GameName], [TotalGames], [TotalAttemptsWon], [WinCount], [BestScore])
+        VALUES (
+            @GameName,
+            1,
+            CASE WHEN @Won = 1 THEN @Attempts ELSE 0 END,
+            CASE WHEN @Won = 1 THEN 1 ELSE 0 END,
+            CASE WHEN @Won = 1 THEN @Attempts ELSE NULL END
+        );
+    END
+    
+    COMMIT TRANSACTION;
+    
     -- Return the new record ID
-    SELECT SCOPE_IDENTITY() AS NewId;
+    SELECT @NewId AS NewId;
     
     RETURN 0;
 END
@@ -185,7 +302,7 @@ PRINT 'Stored procedure usp_GetGameStats created successfully.';
 GO
 
 -- =============================================================================
--- SECTION 5: Sample Data (Optional - Comment out in production)
+-- SECTION 6: Sample Data (Optional - Comment out in production)
 -- =============================================================================
 
 /*
@@ -198,11 +315,28 @@ VALUES
     ('GuessTheNumber', 12, 1, DATEADD(DAY, -4, GETUTCDATE())),
     ('GuessTheNumber', 7, 1, DATEADD(DAY, -3, GETUTCDATE()));
 
+-- The counters were seeded in SECTION 3, so rebuild them from GameResults
+UPDATE c
+SET TotalGames = a.TotalGames,
+    TotalAttemptsWon = a.TotalAttemptsWon,
+    WinCount = a.WinCount,
+    BestScore = a.BestScore
+FROM [dbo].[GameStatsCounters] c
+CROSS APPLY (
+    SELECT 
+        COUNT(*) AS TotalGames,
+        ISNULL(SUM(CASE WHEN Won = 1 THEN CAST(Attempts AS BIGINT) ELSE 0 END), 0) AS TotalAttemptsWon,
+        ISNULL(SUM(CASE WHEN Won = 1 THEN 1 ELSE 0 END), 0) AS WinCount,
+        MIN(CASE WHEN Won = 1 THEN Attempts END) AS BestScore
+    FROM [dbo].[GameResults] r
+    WHERE r.GameName = c.GameName
+) a;
+
 PRINT 'Sample data inserted successfully.';
 */
 
 -- =============================================================================
--- SECTION 6: Verification Queries
+-- SECTION 7: Verification Queries
 -- =============================================================================
 
 -- Verify database structure
@@ -219,12 +353,12 @@ SELECT
 FROM sys.tables t
 INNER JOIN sys.columns c ON t.object_id = c.object_id
 INNER JOIN sys.types ty ON c.user_type_id = ty.user_type_id
-WHERE t.name = 'GameResults'
-ORDER BY c.column_id;
+WHERE t.name IN ('GameResults', 'GameStatsCounters')
+ORDER BY t.name, c.column_id;
 
 PRINT '';
 PRINT '=== Setup Complete ===';
 PRINT 'Database: CodingPortfolio';
-PRINT 'Table: GameResults';
+PRINT 'Tables: GameResults, GameStatsCounters';
 PRINT '';
 GO